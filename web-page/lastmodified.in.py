@@ -2,7 +2,7 @@
 
 import os
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 
 
@@ -11,6 +11,5 @@ page = Path(sys.argv[1])
 basename = sys.argv[2]
 file = Path(os.environ["NANCY_INPUT"]) / page.parent / basename
 
-time = os.stat(file).st_mtime
-dt = datetime.fromtimestamp(time)
-print(dt.strftime("%Y/%m/%d"), end="")
+mtime = os.stat(file).st_mtime
+print(time.strftime("%Y/%m/%d", time.localtime(mtime)), end="")
@@ -2,7 +2,6 @@
 # Output the path from the first argument to the root of the directory
 
 import os
-import re
 import sys
 
 
@@ -10,7 +9,11 @@ import sys
 page = sys.argv[1]
 directory = os.path.dirname(page)
 
-path_to_root = re.sub("[^ ./][^/]*", "..", directory)
+# Replace each directory name with "..". Avoid `re`, whose import costs
+# more than the rest of this script, which is run for every page.
+path_to_root = "/".join(
+    ".." if part.lstrip(" .") != "" else part for part in directory.split("/")
+)
 if path_to_root == "":
     path_to_root = "."
 
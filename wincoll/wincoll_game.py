@@ -11,6 +11,8 @@ import importlib.resources
 import os
 import warnings
 from enum import StrEnum, auto
+from itertools import chain
+from typing import cast
 
 from chambercourt.game import Game
 
@@ -63,6 +65,8 @@ class WincollGame(Game[Tile]):
         self.drilling = False
         self.dead = False
         self.diamonds: int
+        self.rounded_gids: dict[str, set[int]]
+        self.settled_position: Vector2 | None = None
         self.die_image: pygame.Surface
         self.die_sound: pygame.mixer.Sound
         self.default_screen_scale = 2
@@ -72,6 +76,7 @@ class WincollGame(Game[Tile]):
 
         self.diamond_image: pygame.Surface
         self.diamond_icon_image: pygame.Surface
+        self.score_diamond_image: pygame.Surface | None = None
 
         self.collect_sound: pygame.mixer.Sound
         self.rock_sound: pygame.mixer.Sound
@@ -101,14 +106,50 @@ Avoid falling rocks!
         self.falling = False
         self.rock_sound.stop()
 
+    def map_rows(self) -> list[list[int]]:
+        # The map's tile gids, indexed by row and then by column.
+        return cast(list[list[int]], self._map_tiles)
+
+    def redraw_cells(self, cells: list[tuple[int, int]]) -> None:
+        # Redraw the given `(x, y)` cells of the map in one batch.
+        # NOTE: We invoke protected methods and access protected members.
+        rows = self.map_rows()
+        gids = [rows[y][x] for x, y in cells]
+        empty_gids = [self._gids[self.empty_tile]] * len(cells)
+        ml = self._map_layer
+        assert type(ml._buffer) is pygame.Surface
+        # Draw the empty tile first, to allow for transparent tiles.
+        for pass_gids in (empty_gids, gids):
+            for (x, y), gid in zip(cells, pass_gids):
+                rows[y][x] = gid
+            assert ml._tile_queue is not None
+            ml._tile_queue = chain(
+                ml._tile_queue,
+                *(ml.data.get_tile_images_by_rect((x, y, 1, 1)) for x, y in cells),
+            )
+            ml._flush_tile_queue(ml._buffer)
+
+    def set_cells(self, cells: list[tuple[int, int]], tile: Tile) -> None:
+        # Like calling `set()` on each of the given `(x, y)` cells, but
+        # redraws them all at once, rather than one at a time.
+        rows = self.map_rows()
+        gid = self._gids[tile]
+        for x, y in cells:
+            rows[y][x] = gid
+        self.redraw_cells(cells)
+
     # Overrides.
     def load_assets(self) -> None:
         super().load_assets()
-        self.die_image = pygame.image.load(self.find_asset("Die.png"))
+        self.die_image = pygame.image.load(self.find_asset("Die.png")).convert_alpha()
         self.die_sound = pygame.mixer.Sound(self.find_asset("Die.wav"))
         self.die_sound.set_volume(self.default_volume)
-        self.diamond_image = pygame.image.load(self.find_asset("Diamond.png"))
-        self.diamond_icon_image = pygame.image.load(self.find_asset("DiamondIcon.png"))
+        self.diamond_image = pygame.image.load(
+            self.find_asset("Diamond.png")
+        ).convert_alpha()
+        self.diamond_icon_image = pygame.image.load(
+            self.find_asset("DiamondIcon.png")
+        ).convert_alpha()
         self.collect_sound = pygame.mixer.Sound(self.find_asset("Collect.wav"))
         self.collect_sound.set_volume(self.default_volume)
         self.rock_sound = pygame.mixer.Sound(str(self.find_asset("Slide.wav")))
@@ -123,14 +164,36 @@ Avoid falling rocks!
         self.drill_sound.set_volume(self.default_volume)
 
     def init_game(self) -> None:
-        super().init_game()
-        self.diamonds = 0
+        # Find the hero by its gid, rather than calling the base class
+        # method, which looks up the tile in every cell. As there, the hero
+        # goes to the last hero tile in column order, and all hero tiles
+        # are emptied.
+        rows = self.map_rows()
+        hero_gid = self._gids[Tile.HERO]
+        heroes = [
+            (x, y)
+            for y, row in enumerate(rows)
+            if hero_gid in row
+            for x, gid in enumerate(row)
+            if gid == hero_gid
+        ]
+        if len(heroes) > 0:
+            self.hero.position = Vector2(max(heroes))
+        self.set_cells(heroes, Tile.EMPTY)
         self.dead = False
-        for x in range(self.level_width):
-            for y in range(self.level_height):
-                block = self.get(Vector2(x, y))
-                if block in (Tile.DIAMOND, Tile.SAFE):
-                    self.diamonds += 1
+        self.settled_position = None
+        # Count diamonds and safes a row at a time.
+        gids = (self._gids[Tile.DIAMOND], self._gids[Tile.SAFE])
+        self.diamonds = sum(row.count(gid) for row in rows for gid in gids)
+        # Gids of the tiles off which a rock rolls to each side.
+        self.rounded_gids = {
+            prop: {
+                gid
+                for tile, gid in self._gids.items()
+                if self.get_tile_properties(tile).get(prop) is True
+            }
+            for prop in ("rounded_left", "rounded_right")
+        }
 
     def handle_game_keys(self, event: pygame.event.Event) -> None:
         super().handle_game_keys(event)
@@ -157,11 +220,15 @@ Avoid falling rocks!
             return True
         elif block == Tile.KEY:
             # Turn safes into diamonds.
-            for x in range(self.level_width):
-                for y in range(self.level_height):
-                    block = self.get(Vector2(x, y))
-                    if block == Tile.SAFE:
-                        self.set(Vector2(x, y), Tile.DIAMOND)
+            safe_gid = self._gids[Tile.SAFE]
+            safes = [
+                (x, y)
+                for y, row in enumerate(self.map_rows())
+                if safe_gid in row
+                for x, gid in enumerate(row)
+                if gid == safe_gid
+            ]
+            self.set_cells(safes, Tile.DIAMOND)
             self.unlock_sound.play()
             return True
         elif block == Tile.ROCK:
@@ -173,55 +240,77 @@ Avoid falling rocks!
         return False
 
     def update_map(self) -> None:
-        new_fall = False
+        # If no rock moved last time, and the hero has not moved since, the
+        # map has not changed, so no rock can move now.
+        if self.settled_position == self.hero.position:
+            return
 
-        def rock_to_roll(pos: Vector2, prop: str) -> bool:
-            if self.get(pos) == Tile.ROCK:
-                block_below = self.get(pos + Vector2(0, 1))
-                props = self.get_tile_properties(block_below)
-                return props.get(prop) is True
+        new_fall = False
+        rows = self.map_rows()
+        empty_gid = self._gids[Tile.EMPTY]
+        empty_gids = (0, empty_gid)  # Missing tiles are gaps
+        rock_gid = self._gids[Tile.ROCK]
+        hero_gid = self._gids[Tile.HERO]
+        rounded_gids = self.rounded_gids
+        width = self.level_width
+        # Cells changed by falling rocks, to redraw after the scan.
+        moved: list[tuple[int, int]] = []
+
+        def rock_to_roll(x: int, y: int, prop: str) -> bool:
+            if 0 <= x < width and rows[y][x] == rock_gid:
+                return rows[y + 1][x] in rounded_gids[prop]
             return False
 
-        def fall(oldpos: Vector2, newpos: Vector2) -> None:
-            block_below = self.get(newpos + Vector2(0, 1))
-            if block_below == Tile.HERO and not self.finished():
+        def fall(old_x: int, old_y: int, x: int, y: int) -> None:
+            hero_below = y + 1 < self.level_height and rows[y + 1][x] == hero_gid
+            if hero_below and not self.finished():
                 self.dead = True
-            self.set(oldpos, Tile.EMPTY)
-            self.set(newpos, Tile.ROCK)
+            rows[old_y][old_x] = empty_gid
+            rows[y][x] = rock_gid
+            moved.extend(((old_x, old_y), (x, y)))
             nonlocal new_fall
             if self.falling is False:
                 self.falling = True
                 self.rock_sound.play(-1)
             new_fall = True
 
-        # Put Win into the map for collision detection
-        self.set(self.hero.position, Tile.HERO)
+        # Put Win into the map for collision detection. The cell is not
+        # redrawn until the hero is taken out again below.
+        hero_x, hero_y = int(self.hero.position.x), int(self.hero.position.y)
+        rows[hero_y][hero_x] = hero_gid
 
         # Scan the map in bottom-to-top left-to-right order (excluding the
         # top row); for each space consider any rock above, then above
-        # right, then above left.
+        # left, then above right. Read gids straight from the map rows, and
+        # only visit the spaces directly below or diagonally below a rock,
+        # as no other space can have a rock fall into it.
         for y in range(self.level_height - 1, 0, -1):
-            for x in range(self.level_width):
-                pos = Vector2(x, y)
-                block = self.get(pos)
-                if block == Tile.EMPTY:
-                    pos_above = pos + Vector2(0, -1)
-                    block_above = self.get(pos_above)
-                    if block_above == Tile.ROCK:
-                        fall(pos_above, pos)
-                    elif block_above == Tile.EMPTY:
-                        pos_left = pos_above + Vector2(-1, 0)
-                        if rock_to_roll(pos_left, "rounded_right"):
-                            fall(pos_left, pos)
-                        else:
-                            pos_right = pos_above + Vector2(1, 0)
-                            if rock_to_roll(pos_right, "rounded_left"):
-                                fall(pos_right, pos)
+            row, row_above = rows[y], rows[y - 1]
+            if rock_gid not in row_above:
+                continue
+            near_rocks = {
+                x + dx
+                for x, gid in enumerate(row_above)
+                if gid == rock_gid
+                for dx in (-1, 0, 1)
+            }
+            for x in sorted(near_rocks):
+                if 0 <= x < width and row[x] in empty_gids:
+                    if row_above[x] == rock_gid:
+                        fall(x, y - 1, x, y)
+                    elif row_above[x] in empty_gids:
+                        if rock_to_roll(x - 1, y - 1, "rounded_right"):
+                            fall(x - 1, y - 1, x, y)
+                        elif rock_to_roll(x + 1, y - 1, "rounded_left"):
+                            fall(x + 1, y - 1, x, y)
+        rows[hero_y][hero_x] = empty_gid
+        moved.append((hero_x, hero_y))
+        self.redraw_cells(moved)
 
         if self.falling and new_fall is False:
             self.reset_falling()
 
-        self.set(self.hero.position, Tile.EMPTY)
+        self.settled_position = None if new_fall else Vector2(self.hero.position)
 
     async def end_level(self) -> None:
         if self.level < self.num_levels:
@@ -234,11 +323,17 @@ Avoid falling rocks!
 
     def show_status(self) -> None:
         super().show_status()
-        score_diamond = pygame.transform.scale(
-            self.diamond_icon_image, (self.font_pixels, self.font_pixels)
-        )
+        # Scale the diamond icon to the font size only when that changes.
+        size = (self.font_pixels, self.font_pixels)
+        if (
+            self.score_diamond_image is None
+            or self.score_diamond_image.get_size() != size
+        ):
+            self.score_diamond_image = pygame.transform.scale(
+                self.diamond_icon_image, size
+            )
         self.surface.blit(
-            score_diamond,
+            self.score_diamond_image,
             (
                 (self.window_pos[0] - self.font_pixels) // 2,
                 int(1.5 * self.font_pixels),